@@ -21,6 +21,10 @@ class QdrantCredentials(CredentialsConfiguration):
     # Persistence path for QdrantLocal. Default: `None`
     path: Optional[str] = None
 
+    def is_local(self) -> bool:
+        """Tells if credentials point to in-process Qdrant (in memory or on a local path)"""
+        return bool(self.path) or self.location == ":memory:"
+
     def __str__(self) -> str:
         return self.location or "localhost"
 
@@ -31,8 +35,8 @@ class QdrantClientOptions(BaseConfiguration):
     port: int = 6333
     # Port of the gRPC interface. Default: 6334
     grpc_port: int = 6334
-    # If `true` - use gPRC interface whenever possible in custom methods
-    prefer_grpc: bool = False
+    # If `true` - use gPRC interface whenever possible in custom methods. Default: `None` (gRPC is used)
+    prefer_grpc: Optional[bool] = None
     # If `true` - use HTTPS(SSL) protocol. Default: `None`
     https: bool = False
     # If not `None` - add `prefix` to the REST URL path.
@@ -64,7 +68,7 @@ class QdrantClientConfiguration(DestinationClientDwhConfiguration):
 
     # Batch size for generating embeddings
     embedding_batch_size: int = 32
-    # Number of parallel processes for generating embeddings
+    # Number of parallel processes for generating embeddings. 0 uses all cpus
     embedding_parallelism: int = 0
 
     # Batch size for uploading embeddings
@@ -74,6 +78,9 @@ class QdrantClientConfiguration(DestinationClientDwhConfiguration):
     # Number of retries for uploading embeddings
     upload_max_retries: int = 3
 
+    # Number of state records fetched in a single scroll request when restoring pipeline state
+    state_scroll_limit: int = 1000
+
     # Qdrant client options
     options: QdrantClientOptions = None
 
@@ -23,6 +23,9 @@ class qdrant(Destination[QdrantClientConfiguration, "QdrantClient"]):
         caps.max_text_data_type_length = 8 * 1024 * 1024
         caps.is_max_text_data_type_length_in_bytes = False
         caps.supports_ddl_transactions = False
+        # each job embeds its documents using all cpus and then uploads them, two jobs
+        # in parallel already keep both the embedding and the upload busy
+        caps.max_parallel_load_jobs = 2
 
         return caps
 
@@ -1,5 +1,25 @@
+import os
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
-from typing import Optional, Sequence, List, Dict, Type, Iterable, Any
+from itertools import chain, islice, tee, zip_longest
+from operator import itemgetter
+from typing import (
+    Optional,
+    Sequence,
+    List,
+    Dict,
+    Type,
+    Iterable,
+    Iterator,
+    Any,
+    IO,
+    Tuple,
+    Set,
+    Callable,
+    ClassVar,
+)
 
 from dlt.common import logger
 from dlt.common.json import json
@@ -12,6 +32,7 @@ from dlt.common.schema.utils import (
     version_table,
 )
 from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.destination.exceptions import DestinationTerminalException
 from dlt.common.destination.reference import TLoadJobState, LoadJob, JobClientBase, WithStateSync
 from dlt.common.storages import FileStorage
 from dlt.common.time import precise_time
@@ -23,9 +44,10 @@ from dlt.destinations.utils import get_pipeline_state_query_columns
 from dlt.destinations.impl.qdrant.configuration import QdrantClientConfiguration
 from dlt.destinations.impl.qdrant.qdrant_adapter import VECTORIZE_HINT
 
+import numpy as np
+from tenacity import retry, stop_after_attempt
 from qdrant_client import QdrantClient as QC, models
 from qdrant_client.qdrant_fastembed import uuid
-from qdrant_client.http.exceptions import UnexpectedResponse
 
 
 class LoadQdrantJob(LoadJob):
@@ -42,52 +64,95 @@ class LoadQdrantJob(LoadJob):
         self.db_client = db_client
         self.collection_name = collection_name
         self.embedding_fields = get_columns_names_with_prop(table_schema, VECTORIZE_HINT)
-        self.unique_identifiers = self._list_unique_identifiers(table_schema)
+        self.unique_identifiers = tuple(self._list_unique_identifiers(table_schema))
         self.config = client_config
+        # uuid5 is sha1 over namespace + name so hash the constant prefix only once
+        self._uuid_prefix = hashlib.sha1(  # nosec B324 - not used for security
+            uuid.NAMESPACE_DNS.bytes + collection_name.encode("utf-8")
+        )
 
-        with FileStorage.open_zipsafe_ro(local_path) as f:
-            docs, payloads, ids = [], [], []
+        with FileStorage.open_zipsafe_ro(local_path, "rb") as f:
+            self._upload_data(self._iter_embedded(self._iter_records(f)))
 
-            for line in f:
-                data = json.loads(line)
-                point_id = (
-                    self._generate_uuid(data, self.unique_identifiers, self.collection_name)
-                    if self.unique_identifiers
-                    else uuid.uuid4()
-                )
-                payloads.append(data)
-                ids.append(point_id)
-                if len(self.embedding_fields) > 0:
-                    docs.append(self._get_embedding_doc(data))
-
-            if len(self.embedding_fields) > 0:
-                embedding_model = db_client._get_or_init_model(db_client.embedding_model_name)
-                embeddings = list(
-                    embedding_model.embed(
-                        docs,
-                        batch_size=self.config.embedding_batch_size,
-                        parallel=self.config.embedding_parallelism,
-                    )
-                )
-                vector_name = db_client.get_vector_field_name()
-                embeddings = [{vector_name: embedding.tolist()} for embedding in embeddings]
-            else:
-                embeddings = [{}] * len(ids)
-            assert len(embeddings) == len(payloads) == len(ids)
+    def _iter_records(self, f: IO[bytes]) -> Iterator[Tuple[Any, Dict[str, Any], Optional[str]]]:
+        """Parses jsonl lines one by one.
 
-            self._upload_data(vectors=embeddings, ids=ids, payloads=payloads)
+        Args:
+            f (IO[bytes]): A jsonl file opened in binary mode.
 
-    def _get_embedding_doc(self, data: Dict[str, Any]) -> str:
-        """Returns a document to generate embeddings for.
+        Yields:
+            Tuple[Any, Dict[str, Any], Optional[str]]: A point id, a payload and a document to embed
+                (None if table has no fields to embed).
+        """
+        # build the document to embed with C level itemgetter and join. note that itemgetter
+        # returns a bare value (not a tuple) for a single key
+        embedding_values = (
+            itemgetter(*self.embedding_fields) if len(self.embedding_fields) > 1 else None
+        )
+        embedding_field = self.embedding_fields[0] if len(self.embedding_fields) == 1 else None
+        doc: Optional[str] = None
+        for line in f:
+            data = json.loadb(line)
+            point_id = self._generate_uuid(data) if self.unique_identifiers else uuid.uuid4()
+            if embedding_values is not None:
+                doc = "\n".join(map(str, embedding_values(data)))
+            elif embedding_field is not None:
+                doc = str(data[embedding_field])
+            yield point_id, data, doc
+
+    def _iter_embedded(
+        self, records: Iterator[Tuple[Any, Dict[str, Any], Optional[str]]]
+    ) -> Iterator[Tuple[Any, Dict[str, Any], Dict[str, Any]]]:
+        """Generates embeddings for a stream of records.
 
         Args:
-            data (Dict[str, Any]): A dictionary of data to be loaded.
+            records (Iterator[Tuple[Any, Dict[str, Any], Optional[str]]]): Records from `_iter_records`.
 
-        Returns:
-            str: A concatenated string of all the fields intended for embedding.
+        Yields:
+            Tuple[Any, Dict[str, Any], Dict[str, Any]]: A point id, a payload and named vectors.
         """
-        doc = "\n".join(str(data[key]) for key in self.embedding_fields)
-        return doc
+        if len(self.embedding_fields) == 0:
+            for point_id, payload, _ in records:
+                yield point_id, payload, {}
+            return
+
+        embedding_model = self.db_client._get_or_init_model(self.db_client.embedding_model_name)
+        vector_name = self.db_client.get_vector_field_name()
+        batch_size = self.config.embedding_batch_size
+        parallel: Optional[int] = self.config.embedding_parallelism
+        # fastembed shards batches over worker processes, each loading its own model, and
+        # uses all cpus for 0. starting the pool pays off only if every worker gets a full batch
+        workers = (os.cpu_count() or 1) if parallel == 0 else parallel
+        if workers <= 1:
+            parallel, workers = None, 1
+        # the pool is started on each `embed` call so stream the whole file through one call
+        head = list(islice(records, batch_size * workers))
+        docs: Iterable[str]
+        if len(head) < batch_size * workers:
+            records = iter(head)
+            docs = [doc for _, _, doc in head]
+            parallel = None
+        else:
+            records, doc_records = tee(chain(head, records))
+            docs = (doc for _, _, doc in doc_records)
+        embeddings = iter(
+            embedding_model.embed(
+                docs,
+                batch_size=batch_size,
+                parallel=parallel,
+            )
+        )
+        missing: Any = object()
+        embedded = zip_longest(records, embeddings, fillvalue=missing)
+        while chunk := list(islice(embedded, batch_size)):
+            if any(record is missing or embedding is missing for record, embedding in chunk):
+                raise DestinationTerminalException(
+                    f"Number of embeddings does not match number of records in {self.file_name()}"
+                )
+            # convert whole batch of embeddings to python lists in a single call
+            vectors = np.vstack([embedding for _, embedding in chunk]).tolist()
+            for ((point_id, payload, _), _), vector in zip(chunk, vectors):
+                yield point_id, payload, {vector_name: vector}
 
     def _list_unique_identifiers(self, table_schema: TTableSchema) -> Sequence[str]:
         """Returns a list of unique identifiers for a table.
@@ -104,41 +169,79 @@ class LoadQdrantJob(LoadJob):
                 return primary_keys
         return get_columns_names_with_prop(table_schema, "unique")
 
-    def _upload_data(
-        self, ids: Iterable[Any], vectors: Iterable[Any], payloads: Iterable[Any]
+    def _upload_data(self, points: Iterator[Tuple[Any, Dict[str, Any], Dict[str, Any]]]) -> None:
+        """Uploads data to a Qdrant instance in batches. Supports retries and parallelism.
+
+        Batches are upserted without waiting for the server to apply them. The last batch waits so
+        all points are applied when the job completes, as qdrant applies updates in order.
+
+        Args:
+            points (Iterator[Tuple[Any, Dict[str, Any], Dict[str, Any]]]): Point ids, payloads and
+                named vectors to be uploaded to the collection
+        """
+        upsert = retry(stop=stop_after_attempt(self.config.upload_max_retries), reraise=True)(
+            self._upsert_batch
+        )
+        batch_size = self.config.upload_batch_size
+        batches = iter(lambda: list(islice(points, batch_size)), [])
+        batch = next(batches, None)
+        if batch is None:
+            return
+        # in-process qdrant is not thread safe
+        parallel = 1 if self.config.credentials.is_local() else self.config.upload_parallelism
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            in_flight: Set["Future[None]"] = set()
+            for next_batch in batches:
+                in_flight.add(pool.submit(upsert, batch, False))
+                batch = next_batch
+                # bound the number of batches read from the file ahead of the upload
+                if len(in_flight) >= 2 * parallel:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+            for future in in_flight:
+                future.result()
+        upsert(batch, True)
+
+    def _upsert_batch(
+        self, batch: List[Tuple[Any, Dict[str, Any], Dict[str, Any]]], wait_result: bool
     ) -> None:
-        """Uploads data to a Qdrant instance in a batch. Supports retries and parallelism.
+        """Upserts a single batch of points. Retried with tenacity by `_upload_data`.
 
         Args:
-            ids (Iterable[Any]): Point IDs to be uploaded to the collection
-            vectors (Iterable[Any]): Embeddings to be uploaded to the collection
-            payloads (Iterable[Any]): Payloads to be uploaded to the collection
+            batch (List[Tuple[Any, Dict[str, Any], Dict[str, Any]]]): Point ids, payloads and named
+                vectors to be upserted to the collection
+            wait_result (bool): If `True`, wait until the server applied the batch
         """
-        self.db_client.upload_collection(
+        self.db_client.upsert(
             self.collection_name,
-            ids=ids,
-            payload=payloads,
-            vectors=vectors,
-            parallel=self.config.upload_parallelism,
-            batch_size=self.config.upload_batch_size,
-            max_retries=self.config.upload_max_retries,
+            points=[
+                models.PointStruct(id=point_id, payload=payload, vector=vector)
+                for point_id, payload, vector in batch
+            ],
+            wait=wait_result,
         )
 
-    def _generate_uuid(
-        self, data: Dict[str, Any], unique_identifiers: Sequence[str], collection_name: str
-    ) -> str:
+    def _generate_uuid(self, data: Dict[str, Any]) -> str:
         """Generates deterministic UUID. Used for deduplication.
 
+        Produces the same value as `uuid.uuid5(uuid.NAMESPACE_DNS, collection_name + data_id)`
+        without hashing the namespace and collection name for each record.
+
         Args:
             data (Dict[str, Any]): Arbitrary data to generate UUID for.
-            unique_identifiers (Sequence[str]): A list of unique identifiers.
-            collection_name (str): Qdrant collection name.
 
         Returns:
             str: A string representation of the generated UUID
         """
-        data_id = "_".join(str(data[key]) for key in unique_identifiers)
-        return str(uuid.uuid5(uuid.NAMESPACE_DNS, collection_name + data_id))
+        data_id = "_".join([str(data[key]) for key in self.unique_identifiers])
+        h = self._uuid_prefix.copy()
+        h.update(data_id.encode("utf-8"))
+        d = bytearray(h.digest()[:16])
+        # set version 5 and RFC 4122 variant bits
+        d[6] = (d[6] & 0x0F) | 0x50
+        d[8] = (d[8] & 0x3F) | 0x80
+        return f"{d[:4].hex()}-{d[4:6].hex()}-{d[6:8].hex()}-{d[8:10].hex()}-{d[10:].hex()}"
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -150,6 +253,12 @@ class LoadQdrantJob(LoadJob):
 class QdrantClient(JobClientBase, WithStateSync):
     """Qdrant Destination Handler"""
 
+    # lowest id given to a point without vector in this process
+    _last_point_id: ClassVar[int] = 2**64
+    _point_id_lock: ClassVar[threading.Lock] = threading.Lock()
+    # a client is created per job and state sync so tell about the gRPC default only once
+    _grpc_default_logged: ClassVar[bool] = False
+
     def __init__(
         self,
         schema: Schema,
@@ -170,6 +279,18 @@ class QdrantClient(JobClientBase, WithStateSync):
         self.config: QdrantClientConfiguration = config
         self.db_client: QC = None
         self.model = config.model
+        # snapshot of existing collections used to batch existence checks
+        self._known_collections: Optional[Set[str]] = None
+
+        # normalize property names of the dlt tables once
+        self._p_load_id = schema.naming.normalize_identifier("load_id")
+        self._p_dlt_load_id = schema.naming.normalize_identifier("_dlt_load_id")
+        self._p_pipeline_name = schema.naming.normalize_identifier("pipeline_name")
+        self._p_version_hash = schema.naming.normalize_identifier("version_hash")
+        self._p_schema_name = schema.naming.normalize_identifier("schema_name")
+        self._loads_collection = self._make_qualified_collection_name(schema.loads_table_name)
+        self._state_collection = self._make_qualified_collection_name(schema.state_table_name)
+        self._version_collection = self._make_qualified_collection_name(schema.version_table_name)
 
     @property
     def dataset_name(self) -> str:
@@ -179,8 +300,8 @@ class QdrantClient(JobClientBase, WithStateSync):
     def sentinel_collection(self) -> str:
         return self.dataset_name or "DltSentinelCollection"
 
-    @staticmethod
-    def _create_db_client(config: QdrantClientConfiguration) -> QC:
+    @classmethod
+    def _create_db_client(cls, config: QdrantClientConfiguration) -> QC:
         """Generates a Qdrant client from the 'qdrant_client' package.
 
         Args:
@@ -191,6 +312,15 @@ class QdrantClient(JobClientBase, WithStateSync):
         """
         credentials = dict(config.credentials)
         options = dict(config.options)
+        if options.get("prefer_grpc") is None:
+            # gRPC is considerably faster for batched uploads. local mode ignores it
+            options["prefer_grpc"] = True
+            if not cls._grpc_default_logged:
+                cls._grpc_default_logged = True
+                logger.info(
+                    "Qdrant client uses gRPC transport. Set `prefer_grpc` to false in Qdrant"
+                    " client options to use REST."
+                )
         client = QC(**credentials, **options)
         client.set_model(config.model)
         return client
@@ -233,6 +363,25 @@ class QdrantClient(JobClientBase, WithStateSync):
         # TODO: we can use index hints to create indexes on properties or full text
         # self.db_client.create_payload_index(full_collection_name, "_dlt_load_id", field_type="float")
 
+    @classmethod
+    def _reserve_point_ids(cls, count: int) -> int:
+        """Reserves `count` consecutive decreasing ids for points without vectors.
+
+        Ids follow the clock so points created by other processes are ordered correctly, but are
+        strictly decreasing within the process so points created in the same microsecond do not
+        overwrite each other.
+
+        Args:
+            count (int): Number of ids to reserve.
+
+        Returns:
+            int: The highest reserved id. The remaining ids follow in decreasing order.
+        """
+        with cls._point_id_lock:
+            id_ = min(2**64 - int(precise_time() * 10**6), cls._last_point_id - 1)
+            cls._last_point_id = id_ - count + 1
+        return id_
+
     def _create_point_no_vector(self, obj: Dict[str, Any], collection_name: str) -> None:
         """Inserts a point into a Qdrant collection without a vector.
 
@@ -240,20 +389,58 @@ class QdrantClient(JobClientBase, WithStateSync):
             obj (Dict[str, Any]): The arbitrary data to be inserted as payload.
             collection_name (str): The name of the collection to insert the point into.
         """
+        self._create_points_no_vector([obj], collection_name)
+
+    def _create_points_no_vector(self, objs: List[Dict[str, Any]], collection_name: str) -> None:
+        """Inserts points into a Qdrant collection without vectors in a single request.
+
+        Args:
+            objs (List[Dict[str, Any]]): The arbitrary data to be inserted as payloads.
+            collection_name (str): The name of the collection to insert the points into.
+        """
         # we want decreased ids because the point scroll functions orders by id ASC
-        # so we want newest first
-        id_ = 2**64 - int(precise_time() * 10**6)
+        # so we want newest first. objs later in the list are considered newer
+        id_ = self._reserve_point_ids(len(objs))
         self.db_client.upsert(
             collection_name,
             points=[
                 models.PointStruct(
-                    id=id_,
+                    id=id_ - i,
                     payload=obj,
                     vector={},
                 )
+                for i, obj in enumerate(objs)
             ],
         )
 
+    def _map_collections(self, fun: Callable[[str], Any], collection_names: List[str]) -> None:
+        """Calls `fun` for each collection name, in a thread pool when talking to a Qdrant server.
+
+        All the calls are executed even if some of them fail. The first exception is raised at the end.
+
+        Args:
+            fun (Callable[[str], Any]): A function that accepts a full collection name.
+            collection_names (List[str]): Names of the collections to pass to `fun`.
+        """
+
+        def _call(collection_name: str) -> Optional[Exception]:
+            try:
+                fun(collection_name)
+                return None
+            except Exception as ex:
+                return ex
+
+        max_workers = min(self.config.upload_parallelism, len(collection_names))
+        # in-process qdrant is not thread safe
+        if max_workers > 1 and not self.config.credentials.is_local():
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                errors = list(pool.map(_call, collection_names))
+        else:
+            errors = [_call(collection_name) for collection_name in collection_names]
+        for error in errors:
+            if error is not None:
+                raise error
+
     def drop_storage(self) -> None:
         """Drop the dataset from the Qdrant instance.
 
@@ -262,19 +449,14 @@ class QdrantClient(JobClientBase, WithStateSync):
 
         If dataset name was not provided, it deletes all the tables in the current schema
         """
-        collections = self.db_client.get_collections().collections
-        collection_name_list = [collection.name for collection in collections]
+        collection_names = self._get_collection_names()
 
         if self.dataset_name:
             prefix = f"{self.dataset_name}{self.config.dataset_separator}"
-
-            for collection_name in collection_name_list:
-                if collection_name.startswith(prefix):
-                    self.db_client.delete_collection(collection_name)
+            targets = [name for name in collection_names if name.startswith(prefix)]
         else:
-            for collection_name in self.schema.tables.keys():
-                if collection_name in collection_name_list:
-                    self.db_client.delete_collection(collection_name)
+            targets = [name for name in self.schema.tables.keys() if name in collection_names]
+        self._map_collections(self.db_client.delete_collection, targets)
 
         self._delete_sentinel_collection()
 
@@ -282,13 +464,20 @@ class QdrantClient(JobClientBase, WithStateSync):
         if not self.is_storage_initialized():
             self._create_sentinel_collection()
         elif truncate_tables:
-            for table_name in truncate_tables:
-                qualified_table_name = self._make_qualified_collection_name(table_name=table_name)
-                if self._collection_exists(qualified_table_name):
-                    continue
+            self._known_collections = self._get_collection_names()
+            try:
+                for table_name in truncate_tables:
+                    qualified_table_name = self._make_qualified_collection_name(
+                        table_name=table_name
+                    )
+                    if self._collection_exists(qualified_table_name):
+                        continue
 
-                self.db_client.delete_collection(qualified_table_name)
-                self._create_collection(full_collection_name=qualified_table_name)
+                    self.db_client.delete_collection(qualified_table_name)
+                    self._create_collection(full_collection_name=qualified_table_name)
+                    self._known_collections.add(qualified_table_name)
+            finally:
+                self._known_collections = None
 
     def is_storage_initialized(self) -> bool:
         return self._collection_exists(self.sentinel_collection, qualify_table_name=False)
@@ -323,33 +512,53 @@ class QdrantClient(JobClientBase, WithStateSync):
             )
         return applied_update
 
+    def _get_recent_load_ids(self, limit: int = 1000) -> Tuple[Set[str], bool]:
+        """Fetches ids of the most recent completed loads in a single request.
+
+        Args:
+            limit (int): Maximum number of load ids to fetch.
+
+        Returns:
+            Tuple[Set[str], bool]: A set of load ids and a flag telling if all the loads were fetched.
+        """
+        # loads are points without vectors with decreasing ids so newest go first
+        load_records, offset = self.db_client.scroll(
+            self._loads_collection,
+            with_payload=[self._p_load_id],
+            limit=limit,
+        )
+        return {record.payload[self._p_load_id] for record in load_records}, offset is None
+
     def get_stored_state(self, pipeline_name: str) -> Optional[StateInfo]:
         """Loads compressed state from destination storage
         By finding a load id that was completed
         """
-        # normalize property names
-        p_load_id = self.schema.naming.normalize_identifier("load_id")
-        p_dlt_load_id = self.schema.naming.normalize_identifier("_dlt_load_id")
-        p_pipeline_name = self.schema.naming.normalize_identifier("pipeline_name")
         # p_created_at = self.schema.naming.normalize_identifier("created_at")
 
-        limit = 100
+        limit = self.config.state_scroll_limit
         offset = None
+        try:
+            # prefetch completed loads instead of checking each state separately
+            recent_load_ids, all_loads_fetched = self._get_recent_load_ids()
+        except Exception:
+            return None
+        # filter does not change between pages
+        pipeline_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key=self._p_pipeline_name,
+                    match=models.MatchValue(value=pipeline_name),
+                )
+            ]
+        )
+        # load ids already checked and not found in loads collection
+        missing_load_ids: Set[str] = set()
         while True:
             try:
-                scroll_table_name = self._make_qualified_collection_name(
-                    self.schema.state_table_name
-                )
                 state_records, offset = self.db_client.scroll(
-                    scroll_table_name,
+                    self._state_collection,
                     with_payload=self.pipeline_state_properties,
-                    scroll_filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key=p_pipeline_name, match=models.MatchValue(value=pipeline_name)
-                            )
-                        ]
-                    ),
+                    scroll_filter=pipeline_filter,
                     # search by package load id which is guaranteed to increase over time
                     # order_by=models.OrderBy(
                     #     key=p_created_at,
@@ -363,43 +572,47 @@ class QdrantClient(JobClientBase, WithStateSync):
                     return None
                 for state_record in state_records:
                     state = state_record.payload
-                    load_id = state[p_dlt_load_id]
-                    scroll_table_name = self._make_qualified_collection_name(
-                        self.schema.loads_table_name
-                    )
+                    load_id = state[self._p_dlt_load_id]
+                    if load_id in recent_load_ids:
+                        return StateInfo(**state)
+                    if all_loads_fetched or load_id in missing_load_ids:
+                        continue
+                    # load is older than the prefetched ones
                     load_records = self.db_client.count(
-                        scroll_table_name,
+                        self._loads_collection,
                         exact=True,
                         count_filter=models.Filter(
                             must=[
                                 models.FieldCondition(
-                                    key=p_load_id, match=models.MatchValue(value=load_id)
+                                    key=self._p_load_id, match=models.MatchValue(value=load_id)
                                 )
                             ]
                         ),
                     )
                     if load_records.count > 0:
                         return StateInfo(**state)
+                    missing_load_ids.add(load_id)
+                # no more pages
+                if offset is None:
+                    return None
             except Exception:
                 return None
 
     def get_stored_schema(self) -> Optional[StorageSchemaInfo]:
         """Retrieves newest schema from destination storage"""
         try:
-            scroll_table_name = self._make_qualified_collection_name(self.schema.version_table_name)
-            p_schema_name = self.schema.naming.normalize_identifier("schema_name")
             # this works only because we create points that have no vectors
             # with decreasing ids. so newest (lowest ids) go first
             # we do not use order_by because it requires and index to be created
             # and this behavior is different for local and cloud qdrant
             # p_inserted_at = self.schema.naming.normalize_identifier("inserted_at")
             response = self.db_client.scroll(
-                scroll_table_name,
+                self._version_collection,
                 with_payload=True,
                 scroll_filter=models.Filter(
                     must=[
                         models.FieldCondition(
-                            key=p_schema_name,
+                            key=self._p_schema_name,
                             match=models.MatchValue(value=self.schema.name),
                         )
                     ]
@@ -417,15 +630,13 @@ class QdrantClient(JobClientBase, WithStateSync):
 
     def get_stored_schema_by_hash(self, schema_hash: str) -> Optional[StorageSchemaInfo]:
         try:
-            scroll_table_name = self._make_qualified_collection_name(self.schema.version_table_name)
-            p_version_hash = self.schema.naming.normalize_identifier("version_hash")
             response = self.db_client.scroll(
-                scroll_table_name,
+                self._version_collection,
                 with_payload=True,
                 scroll_filter=models.Filter(
                     must=[
                         models.FieldCondition(
-                            key=p_version_hash, match=models.MatchValue(value=schema_hash)
+                            key=self._p_version_hash, match=models.MatchValue(value=schema_hash)
                         )
                     ]
                 ),
@@ -452,8 +663,7 @@ class QdrantClient(JobClientBase, WithStateSync):
         values = [load_id, self.schema.name, 0, str(pendulum.now()), self.schema.version_hash]
         assert len(values) == len(self.loads_collection_properties)
         properties = {k: v for k, v in zip(self.loads_collection_properties, values)}
-        loads_table_name = self._make_qualified_collection_name(self.schema.loads_table_name)
-        self._create_point_no_vector(properties, loads_table_name)
+        self._create_point_no_vector(properties, self._loads_collection)
 
     def __enter__(self) -> "QdrantClient":
         self.db_client = QdrantClient._create_db_client(self.config)
@@ -481,33 +691,30 @@ class QdrantClient(JobClientBase, WithStateSync):
         ]
         assert len(values) == len(self.version_collection_properties)
         properties = {k: v for k, v in zip(self.version_collection_properties, values)}
-        version_table_name = self._make_qualified_collection_name(self.schema.version_table_name)
-        self._create_point_no_vector(properties, version_table_name)
+        self._create_point_no_vector(properties, self._version_collection)
 
     def _execute_schema_update(self, only_tables: Iterable[str]) -> None:
-        for table_name in only_tables or self.schema.tables:
-            exists = self._collection_exists(table_name)
-
-            if not exists:
-                self._create_collection(
-                    full_collection_name=self._make_qualified_collection_name(table_name)
-                )
+        # probe all the tables against a single listing of collections
+        self._known_collections = self._get_collection_names()
+        try:
+            new_collections = [
+                self._make_qualified_collection_name(table_name)
+                for table_name in only_tables or self.schema.tables
+                if not self._collection_exists(table_name)
+            ]
+        finally:
+            self._known_collections = None
+        self._map_collections(self._create_collection, new_collections)
         self._update_schema_in_storage(self.schema)
 
+    def _get_collection_names(self) -> Set[str]:
+        """Returns names of all the collections in the Qdrant instance"""
+        return {collection.name for collection in self.db_client.get_collections().collections}
+
     def _collection_exists(self, table_name: str, qualify_table_name: bool = True) -> bool:
-        try:
-            table_name = (
-                self._make_qualified_collection_name(table_name)
-                if qualify_table_name
-                else table_name
-            )
-            self.db_client.get_collection(table_name)
-            return True
-        except ValueError as e:
-            if "not found" in str(e):
-                return False
-            raise e
-        except UnexpectedResponse as e:
-            if e.status_code == 404:
-                return False
-            raise e
+        table_name = (
+            self._make_qualified_collection_name(table_name) if qualify_table_name else table_name
+        )
+        if self._known_collections is not None:
+            return table_name in self._known_collections
+        return self.db_client.collection_exists(table_name)
@@ -10,6 +10,7 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from dlt.common.json import json
 from dlt.common.jsonpath import TAnyJsonPath
 from dlt.common.exceptions import TerminalException
 from dlt.common.schema.typing import TSimpleRegex
@@ -46,13 +47,16 @@ def retry_load(
 
     """
 
+    retry_steps = frozenset(retry_on_pipeline_steps)
+
     def _retry_load(ex: BaseException) -> bool:
         # do not retry in normalize or extract stages
-        if isinstance(ex, PipelineStepFailed) and ex.step not in retry_on_pipeline_steps:
+        if isinstance(ex, PipelineStepFailed) and ex.step not in retry_steps:
             return False
         # do not retry on terminal exceptions
+        ctx = ex.__context__
         if isinstance(ex, TerminalException) or (
-            ex.__context__ is not None and isinstance(ex.__context__, TerminalException)
+            ctx is not None and isinstance(ctx, TerminalException)
         ):
             return False
         return True
@@ -83,7 +87,10 @@ class DropCommand:
 
         if not pipeline.default_schema_name:
             raise PipelineNeverRan(pipeline.pipeline_name, pipeline.pipelines_dir)
-        self.schema = pipeline.schemas[schema_name or pipeline.default_schema_name].clone()
+        schema = pipeline.schemas[schema_name or pipeline.default_schema_name]
+        # drop_resources modifies its own copy of the schema. the clone is a snapshot used to
+        # restore dropped tables on failure and is not needed when only state is dropped
+        self.schema = schema if state_only else schema.clone()
 
         drop_result = drop_resources(
             # self._drop_schema, self._new_state, self.info = drop_resources(
@@ -124,7 +131,12 @@ class DropCommand:
             return  # Nothing to drop
 
         self._new_schema._bump_version()
-        new_state = deepcopy(self._new_state)
+        # typed json round trip is faster than deepcopy and yields the same values that
+        # get persisted with the state. fall back for values that cannot be serialized
+        try:
+            new_state = json.typed_loadb(json.typed_dumpb(self._new_state))
+        except TypeError:
+            new_state = deepcopy(self._new_state)
         force_state_extract(new_state)
 
         self.pipeline._save_and_extract_state_and_schema(
@@ -168,7 +180,11 @@ def refresh_source(
     if pipeline.first_run:
         return {}
     pipeline_state, _ = current_pipeline_state(pipeline._container)
-    _resources_to_drop = list(source.resources.extracted) if refresh != "drop_sources" else []
+    # drop_resources makes its own list of resource names so pass the keys view
+    _resources_to_drop = source.resources.extracted.keys() if refresh != "drop_sources" else ()
+    if refresh != "drop_sources" and not _resources_to_drop:
+        # nothing to drop, skip cloning schema and state
+        return {}
     drop_result = drop_resources(
         source.schema,
         pipeline_state,
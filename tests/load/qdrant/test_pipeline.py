@@ -1,4 +1,5 @@
 import pytest
+import uuid
 from typing import Iterator
 
 import dlt
@@ -246,6 +247,16 @@ def test_pipeline_merge() -> None:
     assert_load_info(info)
     assert_collection(pipeline, "movies_data", items=data)
 
+    # point ids are uuid5 of the collection name and the primary key
+    client: QdrantClient
+    with pipeline.destination_client() as client:  # type: ignore[assignment]
+        collection_name = client._make_qualified_collection_name("movies_data")
+        point_records, _ = client.db_client.scroll(collection_name, limit=50)
+    assert {point.id for point in point_records} == {
+        str(uuid.uuid5(uuid.NAMESPACE_DNS, collection_name + str(movie["doc_id"])))
+        for movie in data
+    }
+
 
 def test_pipeline_with_schema_evolution():
     data = [
@@ -361,3 +372,34 @@ def test_empty_dataset_allowed() -> None:
     assert client.dataset_name is None
     assert client.sentinel_collection == "DltSentinelCollection"
     assert_collection(p, "content", expected_items_count=3)
+
+
+def test_embed_multiple_batches() -> None:
+    # more documents than fit in a single embedding batch
+    data = [{"doc_id": i, "content": f"document {i}"} for i in range(100)]
+
+    pipeline = dlt.pipeline(
+        pipeline_name="test_embed_multiple_batches",
+        destination="qdrant",
+        dataset_name="TestEmbedMultipleBatches" + uniq_id(),
+    )
+    info = pipeline.run(
+        qdrant_adapter(data, embed=["content"]),
+        table_name="content",
+    )
+    assert_load_info(info)
+
+    client: QdrantClient
+    with pipeline.destination_client() as client:  # type: ignore[assignment]
+        collection_name = client._make_qualified_collection_name("content")
+        vector_name = client.db_client.get_vector_field_name()
+        point_records, _ = client.db_client.scroll(
+            collection_name, with_payload=True, with_vectors=True, limit=len(data) + 1
+        )
+
+    assert len(point_records) == len(data)
+    assert sorted(point.payload["doc_id"] for point in point_records) == list(range(len(data)))
+    for point in point_records:
+        assert isinstance(point.vector, dict)
+        vector = point.vector[vector_name]
+        assert isinstance(vector, list) and len(vector) > 0